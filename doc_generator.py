@@ -1,14 +1,174 @@
 import os
 import re
 import sys
+import io
 import json
-import requests
 from datetime import datetime
 from urllib.parse import urljoin
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from collections import Counter, defaultdict
+from itertools import accumulate, repeat
+from bisect import bisect_right
+from contextlib import redirect_stdout
+from operator import attrgetter
 import boto3
 from bedrock import get_bedrock_client, invoke_model
 
+_HTTP_METHODS = ('GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'OPTIONS', 'HEAD')
+# Set form for the per-endpoint and per-token membership checks
+_VALID_METHOD_SET = frozenset(_HTTP_METHODS)
+# Canonical method strings, so endpoints share one object per method instead
+# of each holding its own decoded copy
+_METHOD_INTERN = {method: method for method in _HTTP_METHODS}
+
+# Source discovery: supported extensions and directories never descended into
+_SOURCE_EXTENSIONS = ('.go',)
+_EXCLUDED_DIRS = frozenset({'node_modules', 'vendor', '_build'})
+# Below this many files the process pool costs more than it saves
+_PARALLEL_MIN_FILES = 32
+_MAX_REPORTED_CONFLICTS = 10000  # Conflicts kept for the duplicate report; all are counted
+_INSPECT_WORKERS = 8  # Default number of concurrent probes against the live server
+_PROBED_WRITE_METHODS = frozenset({'POST', 'PUT'})  # Probed only on "create" paths
+# Probe results are reused across runs for a few minutes, keyed by server, method and path
+_PROBE_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'documatic', 'probes.json')
+_PROBE_CACHE_TTL = 300  # Seconds
+_EXAMPLE_STRING_LIMIT = 100  # Longer string values are cut in data shape examples
+_EXAMPLE_LIST_LIMIT = 3  # Array items kept in data shape examples
+# Body sent when probing user creation endpoints, and its documented form
+_SAMPLE_USER_REQUEST = {
+    "name": "Sample User",
+    "email": "sample@example.com"
+}
+_SAMPLE_USER_REQUEST_JSON = json.dumps(_SAMPLE_USER_REQUEST, indent=2)
+
+# Route extraction patterns, compiled once at import instead of per file.
+# File content is scanned as bytes: Go syntax is ASCII, and bytes patterns
+# skip the Unicode-aware matching str patterns pay for on every character.
+# _ROUTE_CALL_RE recognises every supported call form in a single pass; the
+# outer named group (route, handle, handlefunc, path_route) tells them apart.
+# It is wrapped in a lookahead so a loose match (e.g. cache.Get(key, ...)
+# running on to a later line) cannot swallow the route calls after it.
+_METHOD_ALTERNATION = '|'.join(_HTTP_METHODS)
+_ROUTE_CALL_RE = re.compile(rf'''(?=\b(?P<router>\w+)\.(?:
+    # Gin/Echo style router.GET("/path", handler); other routers' r.Get(...) too
+    (?P<route>(?:(?P<method>{_METHOD_ALTERNATION})|(?P<loose_method>(?i:get|post|put|delete|patch)))
+        \s*\(\s*(?P<path>[^,]+)\s*,\s*(?P<handler>[^)]+)\))
+    # Gin router.Handle("GET", "/path", handler)
+    |(?P<handle>Handle\s*\(\s*["'](?P<handle_method>{_METHOD_ALTERNATION})["']
+        \s*,\s*(?P<handle_path>[^,]+)\s*,\s*(?P<handle_handler>[^)]+)\))
+    # net/http http.HandleFunc(...) and Gorilla Mux r.HandleFunc(...).Methods(...)
+    |(?P<handlefunc>HandleFunc\s*\()
+    # Gorilla Mux r.Path("/path").HandlerFunc(handler).Methods("GET")
+    |(?P<path_route>Path\s*\(\s*(?P<mux_path>[^)]+)\)\s*\.HandlerFunc\s*\(\s*(?P<mux_handler>[^)]+)\)
+        \s*\.Methods\s*\(\s*(?P<mux_methods>[^)]+)\s*\))
+))'''.encode(), re.VERBOSE)
+# Arguments of http.HandleFunc, matched right after "HandleFunc("
+_HANDLE_FUNC_ARGS_RE = re.compile(rb'\s*(["\'][^"\']*["\']|\`[^\`]*\`)\s*,\s*([^,)]+)\)')
+_MUX_METHODS_RE = re.compile(rb'\.Methods\s*\(\s*([^)]+)\s*\)')
+_SUBROUTER_RE = re.compile(rb'(\w+)\s*:=\s*\w+\.PathPrefix\s*\(\s*([^)]+)\)\s*\.Subrouter\s*\(\s*\)')
+# Any mention of mux or a router, for the hint printed when a file has no Mux routes
+_MUX_MENTION_RE = re.compile(rb'mux|router', re.IGNORECASE)
+_METHOD_TOKEN_RE = re.compile(rb'["\']([A-Z]+)["\']|(\b[A-Z]{3,7}\b)')
+# Parentheses and commas, for walking HandleFunc(...) argument lists
+_ARG_DELIMITER_RE = re.compile(rb'[(),]')
+# Top-level function definitions up to the opening brace of the body
+_FUNC_DEF_RE = re.compile(rb'func\s+(\w+)\s*\([^)]*\)\s*[^{]*{')
+# Go source split into runs of code and the comment that ends each run, in
+# one scan. String, rune and raw literals are consumed as code, so "//"
+# inside a string is never taken for a comment; a stray quote is plain code.
+_CODE_THEN_COMMENT_RE = re.compile(rb'''
+    (?:[^"'`/]+                               # ordinary code
+      |/(?![/*])                              # division, not a comment opener
+      |"[^"\\\n]*(?:\\.[^"\\\n]*)*"           # interpreted string
+      |'[^'\\\n]*(?:\\.[^'\\\n]*)*'           # rune literal
+      |`[^`]*`                                # raw string
+      |["'`]                                  # unterminated literal
+    )*
+    (?P<comment>//[^\n]*|/\*.*?(?:\*/|\Z))?    # line or block comment (unterminated runs to EOF)
+''', re.DOTALL | re.VERBOSE)
+# Blanks every byte except newlines, so line numbers survive comment removal
+_COMMENT_BLANK_TABLE = bytes(byte if byte == 0x0A else 0x20 for byte in range(256))
+
+# Patterns applied to extracted paths and descriptions, which are str
+# :param (common in many frameworks) or {param} (Gorilla Mux, Echo, etc.)
+_PATH_PARAM_RE = re.compile(r':(\w+)|\{(\w+)\}')
+_HTML_TAG_RE = re.compile(r'<[^>]*>')
+# Keyword sets matched case-insensitively in one pass instead of lowering the text and testing each word
+_AUTH_KEYWORDS_RE = re.compile(r'auth|login|token|bearer|jwt|authorization|authenticated', re.IGNORECASE)
+_RATE_LIMIT_KEYWORDS_RE = re.compile(r'rate limit|rate-limit|throttle|limit|quota', re.IGNORECASE)
+# Comment lines that read like code rather than a description of the handler
+_CODE_LIKE_COMMENT_RE = re.compile(r'http\.|router\.|func\(', re.IGNORECASE)
+
+# curl commands shown for each endpoint; methods that take a body get a JSON one
+_CURL_TEMPLATE = 'curl -X {method} {path}'
+_CURL_TEMPLATES = {
+    method: _CURL_TEMPLATE + ' -H "Content-Type: application/json" -d "{{}}"'
+    for method in ('POST', 'PUT', 'PATCH')
+}
+
+# Example values for well-known path parameters, keyed by lowercased name
+_PARAM_EXAMPLES = {
+    'id': '123',
+    'userid': '123',
+    'user_id': '123',
+    'articleid': '456',
+    'postid': '789',
+    'commentid': '101'
+}
+
+# Literal tokens every route call must contain, as one alternation so a file
+# with no routes at all is rejected in a single scan (generic router verbs
+# are matched case-insensitively, like the loose_method branch above)
+_ROUTE_TOKEN_RE = re.compile(
+    rf'\.(?:{_METHOD_ALTERNATION}|Handle|Path|(?i:get|post|put|delete|patch))'.encode()
+)
+
+# Byte values of \w in a bytes pattern, used to walk back to a router identifier
+_IDENTIFIER_BYTES = frozenset(b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_')
+
+_METHOD_BADGES = {
+    'GET': '🟢 GET',
+    'POST': '🔵 POST',
+    'PUT': '🟡 PUT',
+    'DELETE': '🔴 DELETE',
+    'PATCH': '🟠 PATCH',
+    'OPTIONS': '⚪ OPTIONS',
+    'HEAD': '⚫ HEAD'
+}
+
+# Markdown fragments repeated for every route group and endpoint
+_TOC_GROUP_TEMPLATE = "### {index}. {emoji} {title}\n\n"
+_TOC_ROW_TEMPLATE = "| {badge} | `{path}` | `{handler}` | `curl {curl}` |\n"
+_GROUP_HEADER_TEMPLATE = "### {emoji} {title} Endpoints\n\n"
+_ENDPOINT_TEMPLATE = (
+    "<details>\n<summary>{badge} `{path}`</summary>\n\n"
+    "**📝 Overview**\n"
+    "| Property | Value |\n"
+    "|---|-----|\n"
+    "| 🔧 Handler | `{handler}` |\n"
+    "| 📖 Description | {description} |\n"
+    "\n**🧪 Testing**\n"
+    "```bash\n{curl}\n```\n"
+    "\n**💡 Expected Response**\n"
+    "{response}"
+    "{data_shapes}"
+    "</details>\n\n"
+)
+_DATA_SHAPE_TEMPLATE = "#### {name}\n**Description**: {description}\n\n```json\n{shape}\n```\n"
+_METRIC_TABLE_HEADER = "| Metric | Value |\n|---|-----|\n"
+# Method distribution bars for every possible fill, indexed by filled width
+_BAR_WIDTH = 30
+_BARS = tuple("█" * filled + "░" * (_BAR_WIDTH - filled) for filled in range(_BAR_WIDTH + 1))
+
+# Expected response snippets, chosen by path keyword and method
+_RESPONSE_EXAMPLE_HEALTH = "```json\n{\"status\": \"ok\"}\n```\n"
+_RESPONSE_EXAMPLES_USERS = {
+    'GET': "```json\n[\n  {\n    \"id\": 1,\n    \"name\": \"John Doe\",\n    \"email\": \"john@example.com\"\n  }\n]\n```\n",
+    'POST': "```json\n{\n  \"id\": 3,\n  \"name\": \"New User\",\n  \"email\": \"new@example.com\"\n}\n```\n",
+}
+_RESPONSE_EXAMPLE_DEFAULT = "```json\n{\n  \"message\": \"Success response\"\n}\n```\n"
+
 def generate_llm_description(func_name, func_code):
     """Generates a description for a function using the Bedrock LLM."""
     try:
@@ -20,7 +180,21 @@ def generate_llm_description(func_name, func_code):
         print(f"Error generating LLM description: {e}")
         return ""
 
+def _analyze_file_worker(filepath, use_llm=False):
+    """Extract candidate endpoints from one file in a worker process"""
+    analyzer = GoCodeAnalyzer()
+    analyzer.use_llm = use_llm
+    # Progress messages go back with the endpoints, so the parent can print
+    # them under this file's "Analyzing:" line just as a serial run would
+    output = io.StringIO()
+    with redirect_stdout(output):
+        endpoints = analyzer._extract_endpoints(filepath)
+    return endpoints, output.getvalue()
+
 class APIDocumentation:
+    __slots__ = ('path', 'method', 'description', 'handler_func', 'data_shapes',
+                 'parameters', 'framework')
+
     def __init__(self, path, method, description, handler_func="", data_shapes=None):
         self.path = path
         self.method = method
@@ -29,39 +203,20 @@ class APIDocumentation:
         self.data_shapes = data_shapes or []
         self.parameters = self._extract_parameters(path)
         self.framework = "unknown"
-        self.curl_example = self._generate_curl_example()
-
-    def _generate_curl_example(self):
-        # Generate more sophisticated curl commands
-        if self.method in ["GET", "HEAD"]:
-            example = f"curl -X {self.method} {self.path}"
-        elif self.method in ["POST", "PUT", "PATCH"]:
-            example = f"curl -X {self.method} {self.path} -H \"Content-Type: application/json\" -d \"{{}}\""
-        else:
-            example = f"curl -X {self.method} {self.path}"
 
-        return example
+    @property
+    def curl_example(self):
+        # Built on demand: endpoints dropped as duplicates never need one
+        template = _CURL_TEMPLATES.get(self.method, _CURL_TEMPLATE)
+        return template.format(method=self.method, path=self.path)
 
     def _extract_parameters(self, path):
         """Extract path parameters like :id, {id}, userId"""
         params = []
 
-        # Pattern 1: :param (common in many frameworks)
-        param_matches = re.finditer(r':(\w+)', path)
-        for match in param_matches:
-            param_name = match.group(1)
-            params.append({
-                'name': param_name,
-                'type': 'string',
-                'location': 'path',
-                'example': self._get_param_example(param_name),
-                'required': True
-            })
-
-        # Pattern 2: {param} (Gorilla Mux, Echo, etc.)
-        param_matches = re.finditer(r'\{(\w+)\}', path)
-        for match in param_matches:
-            param_name = match.group(1)
+        # Both parameter styles in one pass, in the order they appear in the path
+        for match in _PATH_PARAM_RE.finditer(path):
+            param_name = match.group(1) or match.group(2)
             params.append({
                 'name': param_name,
                 'type': 'string',
@@ -74,27 +229,19 @@ class APIDocumentation:
 
     def _get_param_example(self, param_name):
         """Generate appropriate example values for parameters"""
-        examples = {
-            'id': '123',
-            'userId': '123',
-            'user_id': '123',
-            'articleId': '456',
-            'postId': '789',
-            'commentId': '101'
-        }
-        return examples.get(param_name.lower(), 'example_value')
+        return _PARAM_EXAMPLES.get(param_name.lower(), 'example_value')
 
     def _check_auth_required(self, input_text):
         """Check if authentication is mentioned in input text"""
-        auth_keywords = ['auth', 'login', 'token', 'bearer', 'jwt', 'authorization', 'authenticated']
-        return any(keyword in input_text.lower() for keyword in auth_keywords)
+        return _AUTH_KEYWORDS_RE.search(input_text) is not None
 
     def _check_rate_limited(self, input_text):
         """Check if rate limiting is mentioned in input text"""
-        rate_keywords = ['rate limit', 'rate-limit', 'throttle', 'limit', 'quota']
-        return any(keyword in input_text.lower() for keyword in rate_keywords)
+        return _RATE_LIMIT_KEYWORDS_RE.search(input_text) is not None
 
 class DataShape:
+    __slots__ = ('name', 'description', 'shape')
+
     def __init__(self, name, description="", shape="{}"):
         self.name = name
         self.description = description
@@ -103,10 +250,12 @@ class DataShape:
 class GoCodeAnalyzer:
     def __init__(self):
         self.endpoints = []
-        self.seen_endpoints = set()  # Track unique endpoints to prevent duplicates
-        self.duplicate_tracker = {}  # Track all attempts to add endpoints
+        self._endpoint_index = {}  # (method, path) -> position in self.endpoints
+        self._first_seen = {}  # (method, path) -> file the endpoint was first found in
         self.duplicate_conflicts = []  # Store duplicate conflicts for reporting
+        self._resolution_counts = Counter()  # Resolution type -> conflicts resolved that way
         self.use_llm = False
+        self.jobs = None  # Worker processes for file analysis (None = one per CPU, 1 = serial)
         self.stats = {
             'files_processed': 0,
             'endpoints_found': 0,
@@ -129,46 +278,59 @@ class GoCodeAnalyzer:
         go_files_found = 0
         total_files_processed = 0
 
-        # Support for additional file extensions
-        supported_extensions = ['.go']
-
         # Robust recursive search with better error handling
         try:
-            for root, dirs, files in os.walk(directory):
-                # Skip hidden directories and common excluded dirs
-                dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['node_modules', 'vendor', '_build']]
-
-                for filename in files:
-                    if any(filename.endswith(ext) for ext in supported_extensions) and self._should_analyze_file(filename):
-                        filepath = os.path.join(root, filename)
-
-                        # Skip very large files (>10MB) to avoid memory issues
-                        try:
-                            file_size = os.path.getsize(filepath)
-                            if file_size > 10 * 1024 * 1024:  # 10MB limit
-                                print(f"⏭️ Skipping large file: {os.path.relpath(filepath, directory)} ({file_size//(1024*1024)}MB)")
-                                continue
-                        except (OSError, IOError) as e:
-                            print(f"⚠️ Cannot access file size: {os.path.relpath(filepath, directory)} - {e}")
-                            continue
-
-                        # Get relative path for cleaner output
-                        rel_path = os.path.relpath(filepath, directory)
-                        print(f"Analyzing: {rel_path}")
-
-                        try:
-                            self._analyze_file(filepath)
-                            go_files_found += 1
-                            total_files_processed += 1
-                        except Exception as e:
-                            error_msg = f"Error analyzing {rel_path}: {str(e)}"
-                            print(f"❌ {error_msg}")
-                            self.stats['errors'].append(error_msg)
-
+            filepaths = []
+            for entry in self._iter_go_files(directory):
+                filepath = entry.path
+                # Skip very large files (>10MB) to avoid memory issues
+                try:
+                    file_size = entry.stat().st_size
+                    if file_size > 10 * 1024 * 1024:  # 10MB limit
+                        print(f"⏭️ Skipping large file: {os.path.relpath(filepath, directory)} ({file_size//(1024*1024)}MB)")
+                        continue
+                except (OSError, IOError) as e:
+                    print(f"⚠️ Cannot access file size: {os.path.relpath(filepath, directory)} - {e}")
+                    continue
+                filepaths.append(filepath)
         except Exception as e:
             print(f"❌ Error walking directory {directory}: {e}")
             return []
 
+        # Extraction is independent per file, so fan it out across processes.
+        # Results come back in file order and are merged serially, which keeps
+        # duplicate detection identical to a single-process run.
+        jobs = self.jobs or os.cpu_count() or 1
+        executor = None
+        if jobs > 1 and len(filepaths) >= _PARALLEL_MIN_FILES:
+            executor = ProcessPoolExecutor(max_workers=jobs)
+            chunksize = max(1, len(filepaths) // (jobs * 4))
+            results = executor.map(_analyze_file_worker, filepaths, repeat(self.use_llm), chunksize=chunksize)
+        else:
+            # Serial extraction prints directly; nothing is left to replay
+            results = ((self._extract_endpoints(filepath), "") for filepath in filepaths)
+
+        try:
+            for filepath in filepaths:
+                # Get relative path for cleaner output
+                rel_path = os.path.relpath(filepath, directory)
+                print(f"Analyzing: {rel_path}")
+
+                try:
+                    endpoints, output = next(results)
+                    if output:
+                        print(output, end="")
+                    self._merge_file_endpoints(filepath, endpoints)
+                    go_files_found += 1
+                    total_files_processed += 1
+                except Exception as e:
+                    error_msg = f"Error analyzing {rel_path}: {str(e)}"
+                    print(f"❌ {error_msg}")
+                    self.stats['errors'].append(error_msg)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
         if go_files_found == 0:
             print(f"⚠️ No Go source files found in {directory}")
             print("💡 Hint: Make sure you're in the correct directory and source files aren't in excluded folders")
@@ -184,7 +346,30 @@ class GoCodeAnalyzer:
             self._print_duplicate_stats()
 
         return self.endpoints
-    
+
+    def _iter_go_files(self, directory):
+        """Yield DirEntry objects for analyzable source files, in the same order as os.walk"""
+        # Explicit stack instead of recursion, so deep trees cannot hit the recursion limit
+        pending = [directory]
+        while pending:
+            subdirs = []
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        # DirEntry caches the file type from the directory listing, so no extra stat calls
+                        if entry.is_dir():
+                            # Skip hidden directories, common excluded dirs and symlinked dirs
+                            if not name.startswith('.') and name not in _EXCLUDED_DIRS and not entry.is_symlink():
+                                subdirs.append(entry.path)
+                        elif name.endswith(_SOURCE_EXTENSIONS) and self._should_analyze_file(name):
+                            yield entry
+            except OSError:
+                # Unreadable directories are skipped, as os.walk does
+                continue
+            # Reversed so the first subdirectory is popped, and walked, first
+            pending.extend(reversed(subdirs))
+
     def _should_analyze_file(self, filename):
         """Determine if a file should be analyzed (exclude tests and other non-route files)"""
         # Skip test files
@@ -214,16 +399,11 @@ class GoCodeAnalyzer:
             print(f"   • Duplicates detected: {self.stats['duplicates_found']}")
             print(f"   • Duplicates skipped: {self.stats['duplicates_skipped']}")
             
-            if self.duplicate_conflicts:
-                print(f"   • Conflicts resolved: {len(self.duplicate_conflicts)}")
+            if self._resolution_counts:
+                print(f"   • Conflicts resolved: {sum(self._resolution_counts.values())}")
                 
                 # Group by resolution type
-                resolutions = {}
-                for conflict in self.duplicate_conflicts:
-                    res_type = conflict['resolution']
-                    resolutions[res_type] = resolutions.get(res_type, 0) + 1
-                
-                for res_type, count in resolutions.items():
+                for res_type, count in self._resolution_counts.items():
                     print(f"     - {res_type.replace('_', ' ').title()}: {count}")
         else:
             print(f"✅ No duplicate endpoints detected")
@@ -233,58 +413,82 @@ class GoCodeAnalyzer:
         if not self.duplicate_conflicts:
             return "No duplicate endpoints detected.\n"
         
-        report = "# Duplicate Endpoints Report\n\n"
-        report += f"Found {len(self.duplicate_conflicts)} duplicate conflicts:\n\n"
+        parts = ["# Duplicate Endpoints Report\n\n"]
+        write = parts.append
+        total = sum(self._resolution_counts.values())
+        write(f"Found {total} duplicate conflicts:\n\n")
+        if total > len(self.duplicate_conflicts):
+            write(f"Only the first {len(self.duplicate_conflicts)} are listed below.\n\n")
         
         for i, conflict in enumerate(self.duplicate_conflicts, 1):
-            report += f"## Conflict {i}: {conflict['method']} {conflict['path']}\n\n"
-            report += f"**Existing:** `{conflict['existing']['handler']}` in `{conflict['existing']['file']}`\n"
-            if conflict['existing']['description']:
-                report += f"- Description: {conflict['existing']['description']}\n"
+            existing, new = conflict['existing'], conflict['new']
+            write(f"## Conflict {i}: {conflict['method']} {conflict['path']}\n\n")
+            write(f"**Existing:** `{existing['handler']}` in `{existing['file']}`\n")
+            if existing['description']:
+                write(f"- Description: {existing['description']}\n")
             
-            report += f"**New:** `{conflict['new']['handler']}` in `{conflict['new']['file']}`\n"
-            if conflict['new']['description']:
-                report += f"- Description: {conflict['new']['description']}\n"
+            write(f"**New:** `{new['handler']}` in `{new['file']}`\n")
+            if new['description']:
+                write(f"- Description: {new['description']}\n")
             
-            report += f"**Resolution:** {conflict['resolution'].replace('_', ' ').title()}\n\n"
-            report += "---\n\n"
+            write(f"**Resolution:** {conflict['resolution'].replace('_', ' ').title()}\n\n---\n\n")
         
-        return report
+        return "".join(parts)
 
-    def _analyze_file(self, filepath):
+    def _merge_file_endpoints(self, filepath, endpoints):
+        """Add the endpoints extracted from one file, tracking the file for duplicate reports"""
         try:
             # Set current file for duplicate tracking
             self.current_file = os.path.basename(filepath)
-            
-            with open(filepath, "r", encoding="utf-8") as f:
-                original_content = f.read()
-                # Keep original content for comment extraction
-                self.original_content = original_content
-                # Remove comments to prevent matching commented-out code
-                content = self._remove_comments(original_content)
-                self._extract_http_handlefunc(content)
-                self._extract_gin_routes(content)
-                self._extract_echo_routes(content)
-                self._extract_mux_routes(content)  # Add Gorilla Mux support
-                self._extract_generic_methods(content)
-        except Exception as e:
-            print(f"Error analyzing {filepath}: {e}")
+            for endpoint in endpoints:
+                # Done here in the parent: endpoints unpickled from worker
+                # processes carry fresh copies of the method string
+                endpoint.method = _METHOD_INTERN.get(endpoint.method, endpoint.method)
+                self._add_endpoint(endpoint)
         finally:
             self.current_file = None
 
+    def _extract_endpoints(self, filepath):
+        """Run the route extractors over one file and return the candidate endpoints"""
+        self._file_endpoints = []
+        # (position, method) of calls already turned into endpoints, so a call
+        # seen by more than one handler is not reported as its own duplicate
+        self._call_sites = set()
+        # Handler comments already looked up in this file, and the offsets of
+        # its function bodies (indexed on first use)
+        self._comment_cache = {}
+        self._func_defs = None
+        try:
+            # Read raw bytes; the route scan runs on bytes directly
+            with open(filepath, "rb") as f:
+                raw = f.read()
+            if b'\r' in raw:
+                raw = raw.replace(b'\r\n', b'\n')
+            # Keep original lines for comment extraction; captured text is
+            # decoded only when it becomes part of an endpoint
+            self._original_lines = raw.split(b'\n')
+            self._line_starts = [0]
+            self._line_starts.extend(accumulate(len(line) + 1 for line in self._original_lines[:-1]))
+            # Remove comments to prevent matching commented-out code
+            content = self._remove_comments(raw)
+            self._extract_routes(content)
+        except Exception as e:
+            print(f"Error analyzing {filepath}: {e}")
+
+        return self._file_endpoints
+
     def _remove_comments(self, content):
-        """Remove Go-style comments to prevent matching commented code"""
-        # More efficient comment removal using compiled regex
-        if not hasattr(self, '_comment_patterns'):
-            self._comment_patterns = [
-                re.compile(r'//.*?$', re.MULTILINE),  # Single-line comments
-                re.compile(r'/\*.*?\*/', re.DOTALL)    # Multi-line comments
-            ]
-        
-        for pattern in self._comment_patterns:
-            content = pattern.sub('', content)
-        
-        return content
+        """Blank out Go-style comments to prevent matching commented code"""
+        # Comments are overwritten with spaces rather than cut out, so match
+        # positions in the result are also valid offsets into the original
+        stripped = None
+        for match in _CODE_THEN_COMMENT_RE.finditer(content):
+            comment = match.group('comment')
+            if comment is not None:
+                if stripped is None:
+                    stripped = bytearray(content)
+                stripped[match.start('comment'):match.end('comment')] = comment.translate(_COMMENT_BLANK_TABLE)
+        return content if stripped is None else bytes(stripped)
 
     def _add_endpoint(self, endpoint):
         """Add endpoint if it's not a duplicate and passes validation"""
@@ -294,25 +498,15 @@ class GoCodeAnalyzer:
             
         endpoint_key = (endpoint.method, endpoint.path)
         
-        # Track all attempts to add endpoints
-        if endpoint_key not in self.duplicate_tracker:
-            self.duplicate_tracker[endpoint_key] = []
-        
-        self.duplicate_tracker[endpoint_key].append({
-            'endpoint': endpoint,
-            'handler': endpoint.handler_func,
-            'description': endpoint.description,
-            'file': getattr(self, 'current_file', 'unknown')
-        })
-        
         # Check for duplicates
-        if endpoint_key in self.seen_endpoints:
+        if endpoint_key in self._endpoint_index:
             self.stats['duplicates_found'] += 1
             self._handle_duplicate_endpoint(endpoint_key, endpoint)
             return
         
-        # Add new endpoint
-        self.seen_endpoints.add(endpoint_key)
+        # Add new endpoint; only its source file is kept for conflict reports
+        self._first_seen[endpoint_key] = getattr(self, 'current_file', 'unknown')
+        self._endpoint_index[endpoint_key] = len(self.endpoints)
         self.endpoints.append(endpoint)
         self.stats['endpoints_found'] += 1
             
@@ -335,14 +529,13 @@ class GoCodeAnalyzer:
             return False
             
         # Validate method
-        valid_methods = {'GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'OPTIONS', 'HEAD'}
-        if endpoint.method not in valid_methods:
+        if endpoint.method not in _VALID_METHOD_SET:
             return False
             
         # Sanitize description to prevent XSS in generated docs
         if endpoint.description:
             # Remove potential HTML/script tags
-            endpoint.description = re.sub(r'<[^>]*>', '', endpoint.description)
+            endpoint.description = _HTML_TAG_RE.sub('', endpoint.description)
             # Limit description length
             if len(endpoint.description) > 1000:
                 endpoint.description = endpoint.description[:1000] + '...'
@@ -353,34 +546,18 @@ class GoCodeAnalyzer:
         """Normalize API path"""
         if not path:
             return ""
-            
-        # Remove extra whitespace
-        path = path.strip()
-        
-        # Ensure path starts with /
-        if not path.startswith('/'):
-            path = '/' + path
-            
-        # Remove duplicate slashes
-        path = re.sub(r'/+', '/', path)
-        
-        # Remove trailing slash unless it's the root path
-        if len(path) > 1 and path.endswith('/'):
-            path = path.rstrip('/')
-            
-        return path
+
+        # Dropping empty segments collapses repeated slashes and removes the
+        # trailing one; the leading slash is added back on join
+        parts = [part for part in path.strip().split('/') if part]
+        return '/' + '/'.join(parts)
     
     def _handle_duplicate_endpoint(self, endpoint_key, new_endpoint):
         """Handle duplicate endpoint detection and resolution"""
         method, path = endpoint_key
-        existing_attempts = self.duplicate_tracker[endpoint_key]
-        
         # Find the existing endpoint in our endpoints list
-        existing_endpoint = None
-        for ep in self.endpoints:
-            if ep.method == method and ep.path == path:
-                existing_endpoint = ep
-                break
+        index = self._endpoint_index.get(endpoint_key)
+        existing_endpoint = self.endpoints[index] if index is not None else None
         
         if existing_endpoint:
             # Create conflict record
@@ -390,7 +567,7 @@ class GoCodeAnalyzer:
                 'existing': {
                     'handler': existing_endpoint.handler_func,
                     'description': existing_endpoint.description,
-                    'file': existing_attempts[0]['file'] if existing_attempts else 'unknown'
+                    'file': self._first_seen.get(endpoint_key, 'unknown')
                 },
                 'new': {
                     'handler': new_endpoint.handler_func,
@@ -406,18 +583,17 @@ class GoCodeAnalyzer:
             
             if resolution == 'replace_with_new':
                 # Replace existing endpoint with new one
-                for i, ep in enumerate(self.endpoints):
-                    if ep.method == method and ep.path == path:
-                        self.endpoints[i] = new_endpoint
-                        conflict['resolution'] = 'replaced_with_new'
-                        break
+                self.endpoints[index] = new_endpoint
+                conflict['resolution'] = 'replaced_with_new'
             elif resolution == 'merge_descriptions':
                 # Merge descriptions from both endpoints
                 if new_endpoint.description and new_endpoint.description not in existing_endpoint.description:
                     existing_endpoint.description += f" | {new_endpoint.description}"
                     conflict['resolution'] = 'descriptions_merged'
             
-            self.duplicate_conflicts.append(conflict)
+            self._resolution_counts[conflict['resolution']] += 1
+            if len(self.duplicate_conflicts) < _MAX_REPORTED_CONFLICTS:
+                self.duplicate_conflicts.append(conflict)
             self.stats['duplicates_skipped'] += 1
             
             # Print warning
@@ -445,254 +621,176 @@ class GoCodeAnalyzer:
         # Default: Keep first endpoint found
         return 'kept_first'
 
-    def _extract_http_handlefunc(self, content):
-        # Find http.HandleFunc calls with more precise regex
-        try:
-            handle_func_pattern = r'http\.HandleFunc\s*\(\s*(["\'][^"\']*["\']|\`[^\`]*\`)\s*,\s*([^,)]+)\)'
-            handle_func_matches = re.finditer(handle_func_pattern, content)
-            
-            for match in handle_func_matches:
-                try:
-                    path = self._clean_string_arg(match.group(1))
-                    handler_func = self._clean_string_arg(match.group(2))
-
-                    # Validate path
-                    if not path or not path.startswith('/'):
-                        continue
-                        
-                    # Look for comments above the call
-                    description = self._find_function_comment(content, handler_func, match.start())
-                    description = self._analyze_handler_function(content, handler_func, description, use_llm=self.use_llm)
-
-                    if path and handler_func:
-                        endpoint = APIDocumentation(
-                            path=path,
-                            method="GET",  # HandleFunc typically handles GET
-                            description=description,
-                            handler_func=handler_func
-                        )
-                        self._add_endpoint(endpoint)
-                except Exception as e:
-                    print(f"⚠️ Error processing HandleFunc match: {e}")
-                    continue
-                    
-        except Exception as e:
-            print(f"⚠️ Error in _extract_http_handlefunc: {e}")
-
-    def _extract_gin_routes(self, content):
-        # Gin router patterns: router.GET, router.POST, etc.
-        methods = [
-            'GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'OPTIONS', 'HEAD'
-        ]
+    def _extract_routes(self, content):
+        """Extract routes for all supported frameworks in one pass over the content"""
+        # Files without any routing call skip the route scan entirely
+        first_token = _ROUTE_TOKEN_RE.search(content)
+        if not first_token:
+            return
 
-        # Group-based routes: router.Group("/api").GET("/users", handler)
-        # Direct method calls: router.GET("/users", handler)
+        # Subrouter prefixes must be known before any Mux route is resolved
+        self._subrouters = self._extract_subrouters(content) if b'.PathPrefix' in content else {}
+        if self._subrouters:
+            print(f"  -> Found {len(self._subrouters)} subrouters: {list(self._subrouters.keys())}")
 
-        for method in methods:
+        handlers = {
+            'route': self._handle_route_call,
+            'handle': self._handle_handle_call,
+            'handlefunc': self._handle_handlefunc_call,
+            'path_route': self._handle_path_route_call,
+        }
+        handlefunc_calls = 0
+        match_call = _ROUTE_CALL_RE.match
+        for token in _ROUTE_TOKEN_RE.finditer(content, first_token.start()):
+            # Anchor the full pattern on the router identifier before the token
+            start = token.start()
+            while start and content[start - 1] in _IDENTIFIER_BYTES:
+                start -= 1
+            match = match_call(content, start) if start != token.start() else None
+            if match is None:
+                continue
+            kind = match.lastgroup
+            if kind == 'handlefunc':
+                handlefunc_calls += 1
             try:
-                # Direct method calls with better regex
-                pattern = rf'\w+\.{method}\s*\(\s*(["\'][^"\']*["\']|\`[^\`]*\`)\s*,\s*([^,)]+)\)'
-                matches = re.finditer(pattern, content)
-                for match in matches:
-                    try:
-                        path = self._clean_string_arg(match.group(1))
-                        handler_func = self._clean_string_arg(match.group(2))
-
-                        # Validate path
-                        if path and path.startswith('/') and handler_func:
-                            description = self._find_function_comment(content, handler_func, match.start())
-                            description = self._analyze_handler_function(content, handler_func, description, use_llm=self.use_llm)
-                            endpoint = APIDocumentation(
-                                path=path,
-                                method=method,
-                                description=description,
-                                handler_func=handler_func
-                            )
-                            self._add_endpoint(endpoint)
-                    except Exception as e:
-                        print(f"⚠️ Error processing {method} route: {e}")
-                        continue
+                handlers[kind](content, match)
             except Exception as e:
-                print(f"⚠️ Error processing {method} routes: {e}")
-
-            # Handle method calls: router.Handle("GET", "/path", handler)
-            pattern = rf'\w+\.Handle\s*\(\s*["\']({method})["\']\s*,\s*([^,]+)\s*,\s*([^)]+)\)'
-            matches = re.finditer(pattern, content)
-            for match in matches:
-                method_name = match.group(1)
-                path = self._clean_string_arg(match.group(2))
-                handler_func = self._clean_string_arg(match.group(3))
-
-                if path:
-                    description = self._find_function_comment(content, handler_func, match.start())
-                    description = self._analyze_handler_function(content, handler_func, description, use_llm=self.use_llm)
-                    endpoint = APIDocumentation(
-                        path=path,
-                        method=method_name,
-                        description=description,
-                        handler_func=handler_func
-                    )
-                    self._add_endpoint(endpoint)
-
-    def _extract_echo_routes(self, content):
-        # Echo router patterns: e.GET, e.POST, etc.
-        methods = [
-            'GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'OPTIONS', 'HEAD'
-        ]
+                print(f"⚠️ Error processing {kind} route: {e}")
 
-        for method in methods:
-            # Echo method calls like e.POST("/users", handler)
-            pattern = rf'\w+\.{method}\s*\(\s*([^,]+)\s*,\s*([^)]+)\)'
-            matches = re.finditer(pattern, content)
-            for match in matches:
-                path = self._clean_string_arg(match.group(1))
-                handler_func = self._clean_string_arg(match.group(2))
-
-                if path:
-                    description = self._find_function_comment(content, handler_func, match.start())
-                    description = self._analyze_handler_function(content, handler_func, description, use_llm=self.use_llm)
-                    endpoint = APIDocumentation(
-                        path=path,
-                        method=method,
-                        description=description,
-                        handler_func=handler_func
-                    )
-                    self._add_endpoint(endpoint)
-
-    def _extract_mux_routes(self, content):
-        """Extract Gorilla Mux routes with enhanced pattern matching including subrouters"""
-        try:
-            # First pass: Extract subrouter definitions
-            subrouters = self._extract_subrouters(content)
-            if subrouters:
-                print(f"  -> Found {len(subrouters)} subrouters: {list(subrouters.keys())}")
-            
-            # Pattern 1: r.HandleFunc("/path", handler).Methods("GET")
-            # Use a more robust approach to find HandleFunc patterns
-            handlefunc_pattern = r'(\w+)\.HandleFunc\s*\('
-            handlefunc_matches = list(re.finditer(handlefunc_pattern, content))
-            if handlefunc_matches:
-                print(f"  -> Found {len(handlefunc_matches)} HandleFunc calls")
-            
-            for match in handlefunc_matches:
-                try:
-                    router_var = match.group(1)
-                    start_pos = match.end()
-                    
-                    # Find the matching closing parenthesis for HandleFunc
-                    paren_count = 1
-                    pos = start_pos
-                    handler_start = None
-                    
-                    while pos < len(content) and paren_count > 0:
-                        if content[pos] == '(':
-                            paren_count += 1
-                        elif content[pos] == ')':
-                            paren_count -= 1
-                        elif content[pos] == ',' and paren_count == 1 and handler_start is None:
-                            # Found the comma separating path from handler
-                            path = content[start_pos:pos].strip()
-                            handler_start = pos + 1
-                        pos += 1
-                    
-                    if handler_start is None:
-                        continue
-                        
-                    # Extract handler function
-                    handler_func = content[handler_start:pos-1].strip()
-                    
-                    # Look for .Methods() after the HandleFunc
-                    remaining = content[pos:pos+200]  # Look ahead
-                    methods_match = re.search(r'\.Methods\s*\(\s*([^)]+)\s*\)', remaining)
-                    if not methods_match:
-                        continue
-                        
-                    methods_str = methods_match.group(1)
-                    path = self._clean_string_arg(path)
-                    handler_func = self._clean_string_arg(handler_func)
-
-                    # Check if this router is a subrouter
-                    full_path = path
-                    if router_var in subrouters:
-                        full_path = subrouters[router_var] + path
-                    
-                    methods_found = self._extract_methods_from_string(methods_str)
-
-                    for method in methods_found:
-                        if full_path:
-                            description = self._find_function_comment(content, handler_func, match.start())
-                            if not description or description.strip() == "":
-                                description = "Router endpoint"
-                            
-                            enhanced_description = self._analyze_handler_function(content, handler_func, description, use_llm=self.use_llm)
-                            
-                            endpoint = APIDocumentation(
-                                path=full_path,
-                                method=method,
-                                description=enhanced_description,
-                                handler_func=handler_func
-                            )
-                            self._add_endpoint(endpoint)
-                            print(f"  -> Added route: {method} {full_path}")
-                except Exception as e:
-                    print(f"Warning: Error processing Mux route: {e}")
-                    continue
+        if handlefunc_calls:
+            print(f"  -> Found {handlefunc_calls} HandleFunc calls")
+        elif self._subrouters or _MUX_MENTION_RE.search(content):
+            print("  -> No Mux routes detected in this file (may use different patterns)")
 
-            # Pattern 2: r.Path("/path").HandlerFunc(handler).Methods("GET")
-            mux_pattern_path = r'(\w+)\.Path\s*\(\s*([^)]+)\)\s*\.HandlerFunc\s*\(\s*([^)]+)\)\s*\.Methods\s*\(\s*([^)]+)\s*\)'
-            matches = re.finditer(mux_pattern_path, content)
-            for match in matches:
-                try:
-                    router_var = match.group(1)
-                    path = self._clean_string_arg(match.group(2))
-                    handler_func = self._clean_string_arg(match.group(3))
-                    methods_str = match.group(4)
-
-                    # Check if this router is a subrouter
-                    full_path = path
-                    if router_var in subrouters:
-                        full_path = subrouters[router_var] + path
-
-                    methods_found = self._extract_methods_from_string(methods_str)
-
-                    for method in methods_found:
-                        if full_path:
-                            description = self._find_function_comment(content, handler_func, match.start())
-                            if not description or description.strip() == "":
-                                description = "Router endpoint"
-                            
-                            enhanced_description = self._analyze_handler_function(content, handler_func, description, use_llm=self.use_llm)
-                            
-                            endpoint = APIDocumentation(
-                                path=full_path,
-                                method=method,
-                                description=enhanced_description,
-                                handler_func=handler_func
-                            )
-                            self._add_endpoint(endpoint)
-                except Exception as e:
-                    print(f"Warning: Error processing Mux Path route: {e}")
-                    continue
-                    
-            
-            # Summary for this file
-            total_routes_found = len(handlefunc_matches) if 'handlefunc_matches' in locals() else 0
-            if total_routes_found == 0 and (subrouters or 'mux' in content.lower() or 'router' in content.lower()):
-                print("  -> No Mux routes detected in this file (may use different patterns)")
-                
-        except Exception as e:
-            print(f"Error in _extract_mux_routes: {e}")
+    def _add_route(self, content, position, path, method, handler_func, default_description=""):
+        """Create an endpoint for a route call unless this call already produced one"""
+        call_site = (position, method)
+        if call_site in self._call_sites:
+            return False
+
+        # Look for comments above the call
+        description = self._find_function_comment(content, handler_func, position)
+        if default_description and not description.strip():
+            description = default_description
+        description = self._analyze_handler_function(content, handler_func, description, use_llm=self.use_llm)
+
+        endpoint = APIDocumentation(
+            path=path,
+            method=method,
+            description=description,
+            handler_func=handler_func
+        )
+        self._call_sites.add(call_site)
+        self._file_endpoints.append(endpoint)
+        return True
+
+    def _handle_route_call(self, content, match):
+        """Gin/Echo style calls: router.GET("/users", handler), e.POST("/users", handler)"""
+        # Group-based routes like router.Group("/api").GET(...) are not resolved
+        method = (match.group('method') or match.group('loose_method').upper()).decode()
+        path = self._clean_string_arg(match.group('path'))
+        handler_func = self._clean_string_arg(match.group('handler'))
+
+        if path:
+            self._add_route(content, match.start(), path, method, handler_func)
+
+    def _handle_handle_call(self, content, match):
+        """Gin method calls: router.Handle("GET", "/path", handler)"""
+        path = self._clean_string_arg(match.group('handle_path'))
+        handler_func = self._clean_string_arg(match.group('handle_handler'))
+
+        if path:
+            self._add_route(content, match.start(), path, match.group('handle_method').decode(), handler_func)
+
+    def _handle_handlefunc_call(self, content, match):
+        """net/http http.HandleFunc("/path", handler) and Mux r.HandleFunc("/path", handler).Methods("GET")"""
+        router_var = match.group('router').decode()
+        start_pos = match.end('handlefunc')
+
+        if router_var == 'http':
+            args = _HANDLE_FUNC_ARGS_RE.match(content, start_pos)
+            if args:
+                path = self._clean_string_arg(args.group(1))
+                handler_func = self._clean_string_arg(args.group(2))
+
+                # Validate path
+                if path and path.startswith('/') and handler_func:
+                    # HandleFunc typically handles GET
+                    self._add_route(content, match.start(), path, "GET", handler_func)
+
+        # Any HandleFunc call, http.HandleFunc included, counts as a Mux route
+        # when it is followed by .Methods(...)
+        # Find the matching closing parenthesis for HandleFunc
+        paren_count = 1
+        pos = len(content)
+        handler_start = None
+
+        for delimiter in _ARG_DELIMITER_RE.finditer(content, start_pos):
+            char = delimiter.group()
+            if char == b'(':
+                paren_count += 1
+            elif char == b')':
+                paren_count -= 1
+                if paren_count == 0:
+                    pos = delimiter.end()
+                    break
+            elif paren_count == 1 and handler_start is None:
+                # Found the comma separating path from handler
+                path = content[start_pos:delimiter.start()].strip()
+                handler_start = delimiter.end()
+
+        if handler_start is None:
+            return
+
+        # Extract handler function
+        handler_func = content[handler_start:pos-1].strip()
+
+        # Look for .Methods() in the 200 characters after the HandleFunc, without slicing
+        methods_match = _MUX_METHODS_RE.search(content, pos, pos + 200)
+        if not methods_match:
+            return
+
+        methods_str = methods_match.group(1)
+        path = self._clean_string_arg(path)
+        handler_func = self._clean_string_arg(handler_func)
+
+        # Check if this router is a subrouter
+        full_path = path
+        if router_var in self._subrouters:
+            full_path = self._subrouters[router_var] + path
+
+        if not full_path:
+            return
+        for method in self._extract_methods_from_string(methods_str):
+            if self._add_route(content, match.start(), full_path, method, handler_func, "Router endpoint"):
+                print(f"  -> Added route: {method} {full_path}")
+
+    def _handle_path_route_call(self, content, match):
+        """Gorilla Mux calls: r.Path("/path").HandlerFunc(handler).Methods("GET")"""
+        router_var = match.group('router').decode()
+        path = self._clean_string_arg(match.group('mux_path'))
+        handler_func = self._clean_string_arg(match.group('mux_handler'))
+        methods_str = match.group('mux_methods')
+
+        # Check if this router is a subrouter
+        full_path = path
+        if router_var in self._subrouters:
+            full_path = self._subrouters[router_var] + path
+
+        if not full_path:
+            return
+        for method in self._extract_methods_from_string(methods_str):
+            self._add_route(content, match.start(), full_path, method, handler_func, "Router endpoint")
     
     def _extract_subrouters(self, content):
         """Extract subrouter definitions like: records := router.PathPrefix("/records").Subrouter()"""
         subrouters = {}
         
         # Pattern: varName := router.PathPrefix("/prefix").Subrouter()
-        subrouter_pattern = r'(\w+)\s*:=\s*\w+\.PathPrefix\s*\(\s*([^)]+)\)\s*\.Subrouter\s*\(\s*\)'
-        matches = re.finditer(subrouter_pattern, content)
+        matches = _SUBROUTER_RE.finditer(content)
         
         for match in matches:
-            var_name = match.group(1)
+            var_name = match.group(1).decode()
             prefix = self._clean_string_arg(match.group(2))
             if prefix:
                 # Ensure prefix doesn't end with slash unless it's root
@@ -704,11 +802,11 @@ class GoCodeAnalyzer:
     
     def _extract_methods_from_string(self, methods_str):
         """Extract HTTP methods from a methods string"""
-        method_matches = re.finditer(r'["\']([A-Z]+)["\']|(\b[A-Z]{3,7}\b)', methods_str)
         methods_found = []
-        for method_match in method_matches:
-            method = method_match.group(1) or method_match.group(2)
-            if method in ['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS']:
+        # findall on these short argument strings skips building match objects
+        for quoted, bare in _METHOD_TOKEN_RE.findall(methods_str):
+            method = (quoted or bare).decode()
+            if method in _VALID_METHOD_SET:
                 methods_found.append(method)
 
         if not methods_found:
@@ -726,9 +824,8 @@ class GoCodeAnalyzer:
                 params = handler_func[handler_func.find('(')+1:handler_func.rfind(')')]
                 
                 # Look for the function definition
-                func_pattern = rf'func\s+{re.escape(main_func)}\s*\([^)]*\)\s*[^{{]*{{'
-                func_match = re.search(func_pattern, content)
-                
+                func_body = self._find_function_body(content, main_func)
+
                 enhancements = []
                 
                 # Analyze parameters for hints about functionality
@@ -737,11 +834,7 @@ class GoCodeAnalyzer:
                 if 'db' in params.lower() or 'conn' in params.lower():
                     enhancements.append("performs database operations")
                 
-                if func_match:
-                    # Get the function body (simplified extraction)
-                    func_start = func_match.end()
-                    func_body = content[func_start:func_start+500]  # First 500 chars of function
-                    
+                if func_body is not None:
                     # Look for common patterns in the handler
                     if 'json.Unmarshal' in func_body or 'json.Decoder' in func_body:
                         enhancements.append("accepts JSON input")
@@ -756,102 +849,77 @@ class GoCodeAnalyzer:
                     return f"{base_description} - {', '.join(enhancements)}"
                 else:
                     return f"{base_description} - calls {main_func} with parameters"
-            else:
-                # Regular function reference
-                func_pattern = rf'func\s+{re.escape(handler_func)}\s*\([^)]*\)\s*[^{{]*{{'
-                func_match = re.search(func_pattern, content)
-                
-                if func_match:
-                    func_start = func_match.end()
-                    func_body = content[func_start:func_start+500]
-                    
-                    enhancements = []
-                    if 'json.Unmarshal' in func_body or 'json.Decoder' in func_body:
-                        enhancements.append("accepts JSON input")
-                    if 'json.Marshal' in func_body or 'json.Encoder' in func_body:
-                        enhancements.append("returns JSON response")
-                    if any(db_keyword in func_body for db_keyword in ['db.', 'database', 'sql.', 'Query', 'Insert', 'Update', 'Delete']):
-                        enhancements.append("performs database operations")
-                    if any(auth_keyword in func_body for auth_keyword in ['auth', 'token', 'jwt', 'session']):
-                        enhancements.append("requires authentication")
-                    if any(val_keyword in func_body for val_keyword in ['validate', 'valid', 'check']):
-                        enhancements.append("includes input validation")
-                    
-                func_pattern = rf'func\s+{re.escape(handler_func)}\s*\([^)]*\)\s*[^{{]*{{(.*?)}}`
-                func_match = re.search(func_pattern, content, re.DOTALL)
-
             return base_description
             
         except Exception as e:
             print(f"⚠️ Error analyzing handler function {handler_func}: {e}")
             return base_description
 
-    def _extract_generic_methods(self, content):
-        # Generic router patterns for other frameworks
-        # This catches method calls that might not be specifically Gin, Echo, or Mux
-        router_patterns = {
-            r'\w+\.(GET|POST|PUT|DELETE|PATCH)\s*\(\s*([^,]+)\s*,\s*([^)]+)\)': lambda m: (m.group(1), m.group(2), m.group(3)),
-        }
+    def _find_function_body(self, content, func_name):
+        """Return the first 500 bytes of a function's body, decoded, or None if it is not defined here"""
+        # One pass indexes every definition in the file; the first one wins
+        if self._func_defs is None:
+            self._func_defs = {}
+            for func_match in _FUNC_DEF_RE.finditer(content):
+                self._func_defs.setdefault(func_match.group(1).decode(), func_match.end())
 
-        for pattern, extractor in router_patterns.items():
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
-                method, path_str, handler_func = extractor(match)
-                path = self._clean_string_arg(path_str)
-                handler_func = self._clean_string_arg(handler_func)
-
-                if path and method not in ['Gin', 'Echo', 'Mux']:  # Avoid duplication
-                    description = self._find_function_comment(content, handler_func, match.start())
-                    description = self._analyze_handler_function(content, handler_func, description, use_llm=self.use_llm)
-                    endpoint = APIDocumentation(
-                        path=path,
-                        method=method.upper(),
-                        description=description,
-                        handler_func=handler_func
-                    )
-                    self._add_endpoint(endpoint)
+        func_start = self._func_defs.get(func_name)
+        if func_start is None:
+            return None
+        # Get the function body (simplified extraction)
+        return content[func_start:func_start+500].decode('utf-8', errors='replace')
 
     def _clean_string_arg(self, arg):
-        """Clean and extract string literals from Go code"""
+        """Clean and extract string literals from scanned Go code, returning str"""
         if not arg:
             return ""
-            
+
         arg = arg.strip()
-        
-        # Handle quoted strings (double or single quotes)
-        if len(arg) >= 2:
-            if (arg.startswith('"') and arg.endswith('"')) or \
-               (arg.startswith("'") and arg.endswith("'")):
+
+        # Literals open and close with the same quote character
+        quote = arg[:1]
+        if len(arg) > 1 and quote == arg[-1:]:
+            # Handle quoted strings (double or single quotes)
+            if quote == b'"' or quote == b"'":
                 # Remove outer quotes and handle escaped quotes
-                inner = arg[1:-1]
+                arg = arg[1:-1]
                 # Unescape common escape sequences
-                inner = inner.replace('\\"', '"').replace("\\'", "'")
-                inner = inner.replace('\\n', '\n').replace('\\t', '\t')
-                return inner
-                
-        # Handle backtick strings (Go raw strings)
-        if arg.startswith('`') and arg.endswith('`') and len(arg) >= 2:
-            return arg[1:-1]
-            
-        return arg
+                arg = arg.replace(b'\\"', b'"').replace(b"\\'", b"'")
+                arg = arg.replace(b'\\n', b'\n').replace(b'\\t', b'\t')
+            # Handle backtick strings (Go raw strings)
+            elif quote == b'`':
+                arg = arg[1:-1]
+
+        # Only the literal itself is decoded, never the surrounding file
+        return arg.decode("utf-8", errors="replace")
 
     def _find_function_comment(self, content, func_name, call_position):
         """Find comments for a function using original content with comments"""
+        # The comment block depends on where the call sits, not only on the handler
+        cache_key = (func_name, call_position)
+        cache = getattr(self, '_comment_cache', None)
+        if func_name and cache is not None and cache_key in cache:
+            return cache[cache_key]
+
         # Use original content to preserve comments
-        if hasattr(self, 'original_content') and self.original_content:
-            content = self.original_content
-        
-        lines = content[:call_position].split('\n')
+        if getattr(self, '_line_starts', None):
+            lines = self._original_lines
+            line_index = bisect_right(self._line_starts, call_position) - 1
+            # Text before the call on its own line, then up to 9 lines above it
+            window = lines[max(0, line_index - 9):line_index]
+            window.append(lines[line_index][:call_position - self._line_starts[line_index]])
+        else:
+            window = content[:call_position].split(b'\n')[-10:]
+
         comment_lines = []
 
         # Look backwards from the call position
-        for line in reversed(lines[-10:]):  # Only check last 10 lines for performance
-            line = line.strip()
+        for line in reversed(window):  # Only check last 10 lines for performance
+            line = line.decode('utf-8', errors='replace').strip()
             if line.startswith('//'):
                 comment_text = line[2:].strip()
                 # Skip empty comments or comments that look like code
-                if comment_text and not any(keyword in comment_text.lower() 
-                                          for keyword in ['http.', 'router.', 'func(']):
+                if comment_text and not _CODE_LIKE_COMMENT_RE.search(comment_text):
                     comment_lines.insert(0, comment_text)
             elif line.startswith('func') and func_name in line:
                 break
@@ -859,22 +927,45 @@ class GoCodeAnalyzer:
                 # Stop if we hit non-comment code after finding comments
                 break
 
-        if comment_lines:
-            return ' '.join(comment_lines)
-        return ""
+        description = ' '.join(comment_lines)
+        if func_name and cache is not None:
+            cache[cache_key] = description
+        return description
 
 class DataInspector:
     """Inspects running servers to get actual data shapes"""
 
-    def __init__(self):
+    def __init__(self, workers=_INSPECT_WORKERS):
         self.base_url = None
         self.server_found = False
+        self.workers = max(1, workers)  # Probes in flight at once; bounds load on the server
+        self.cache_file = _PROBE_CACHE_FILE  # None disables the probe cache
+        # Decoded JSON is always a plain dict or list, so dispatch on the exact type
+        self._response_handlers = {dict: self._process_dict_response, list: self._process_list_response}
+        # requests is imported here rather than at module load, so runs that
+        # never inspect a server skip its import cost
+        import requests
+        from requests.adapters import HTTPAdapter
+        self._request_error = requests.RequestException
+        # Shared session so probes reuse keep-alive connections to the server
+        self.session = requests.Session()
+        self.session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=self.workers))
+
+    def close(self):
+        """Release the pooled connections to the server"""
+        self.session.close()
 
     def find_running_server(self, port):
         """Connect to a running Go server on specified port"""
         try:
             url = f"http://localhost:{port}"
-            response = requests.get(f"{url}/health", timeout=3)
+            # Only the status matters, so skip the body; a dead port fails on
+            # the short connect timeout instead of waiting out the read timeout
+            response = self.session.head(f"{url}/health", timeout=(1, 3), allow_redirects=False)
+            if response.status_code not in (200, 404):
+                # Redirects (/health -> /health/), 405 and servers without HEAD
+                # support get the original GET check, which follows redirects
+                response = self.session.get(f"{url}/health", timeout=(1, 3))
             if response.status_code in [200, 404]:  # 404 means server is running but no /health endpoint
                 self.base_url = url
                 self.server_found = True
@@ -883,7 +974,7 @@ class DataInspector:
             else:
                 print(f" ❌ Server responded but with unexpected status: {response.status_code}")
                 return False
-        except requests.RequestException as e:
+        except self._request_error as e:
             print(f" ❌ Could not connect to server at localhost:{port}")
             print(f"    Error: {e}")
             return False
@@ -895,24 +986,98 @@ class DataInspector:
             return
 
         print("\n🔬 Inspecting server endpoints for data shapes...\n")
+        targets = [endpoint for endpoint in endpoints
+                   if endpoint.method == "GET"
+                   or (endpoint.method in _PROBED_WRITE_METHODS and 'create' in endpoint.path.lower())]
+
+        # Endpoints probed recently against this server take their shapes from the cache
+        cache = self._load_probe_cache()
+        now = time.time()
+        pending = []
         inspected_count = 0
-
-        for endpoint in endpoints:
-            if endpoint.method == "GET" or (endpoint.method in ['POST', 'PUT'] and 'create' in endpoint.path.lower()):
-                try:
-                    if self._inspect_endpoint(endpoint):
-                        inspected_count += 1
-                except Exception as e:
-                    print(f"    ⚠️  Failed to inspect {endpoint.path}: {e}")
+        for endpoint in targets:
+            entry = cache.get(self._probe_cache_key(endpoint))
+            if entry and now - entry['ts'] < _PROBE_CACHE_TTL:
+                endpoint.data_shapes.extend(DataShape(*shape) for shape in entry['shapes'])
+                inspected_count += 1
+            else:
+                pending.append(endpoint)
+        if inspected_count:
+            print(f"  -> Reused cached results for {inspected_count} endpoints")
+
+        # Each endpoint goes to exactly one worker, so its data_shapes are never shared
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            results = list(executor.map(self._probe_endpoint, pending))
+
+        for endpoint, inspected in zip(pending, results):
+            if inspected:
+                inspected_count += 1
+                cache[self._probe_cache_key(endpoint)] = {
+                    'ts': now,
+                    'shapes': [[shape.name, shape.description, shape.shape] for shape in endpoint.data_shapes]
+                }
+        self._save_probe_cache(cache, now)
 
         print(f"🎯 Successfully inspected {inspected_count} endpoints")
 
+    def _probe_cache_key(self, endpoint):
+        return f"{self.base_url}|{endpoint.method}|{endpoint.path}"
+
+    def _load_probe_cache(self):
+        """Read cached probe results, treating a missing or unreadable file as empty"""
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return {}
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except Exception as e:
+            print(f"    ⚠️  Ignoring unreadable probe cache: {e}")
+            return {}
+        if not isinstance(cache, dict):
+            return {}
+        # Malformed entries are dropped so their endpoints are simply probed again
+        return {key: entry for key, entry in cache.items() if self._is_valid_cache_entry(entry)}
+
+    def _is_valid_cache_entry(self, entry):
+        """Check a cache entry has a numeric timestamp and a list of (name, description, shape) triples"""
+        if not isinstance(entry, dict):
+            return False
+        ts, shapes = entry.get('ts'), entry.get('shapes')
+        if isinstance(ts, bool) or not isinstance(ts, (int, float)) or not isinstance(shapes, list):
+            return False
+        return all(isinstance(shape, list) and len(shape) == 3 for shape in shapes)
+
+    def _save_probe_cache(self, cache, now):
+        """Write probe results back, dropping entries that have expired"""
+        if not self.cache_file:
+            return
+        try:
+            fresh = {key: entry for key, entry in cache.items() if now - entry['ts'] < _PROBE_CACHE_TTL}
+            os.makedirs(os.path.dirname(self.cache_file), mode=0o700, exist_ok=True)
+            # Entries hold real response data from the server, so only the
+            # owner may read the file; fchmod also tightens an older file
+            fd = os.open(self.cache_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            if hasattr(os, 'fchmod'):
+                os.fchmod(fd, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(fresh, f)
+        except Exception as e:
+            print(f"    ⚠️  Could not save probe cache: {e}")
+
+    def _probe_endpoint(self, endpoint):
+        """Inspect one endpoint, reporting failures instead of raising"""
+        try:
+            return bool(self._inspect_endpoint(endpoint))
+        except Exception as e:
+            print(f"    ⚠️  Failed to inspect {endpoint.path}: {e}")
+            return False
+
     def _inspect_endpoint(self, endpoint):
         """Inspect a single endpoint to get data shape"""
         try:
             if endpoint.method == "GET":
                 # For GET endpoints, just request the data
-                response = requests.get(urljoin(self.base_url, endpoint.path), timeout=5)
+                response = self.session.get(urljoin(self.base_url, endpoint.path), timeout=5)
                 if response.status_code == 200 and response.headers.get('content-type', '').startswith('application/json'):
                     return self._parse_json_response(endpoint, response.json(), "Response")
                 elif response.status_code == 200:
@@ -925,15 +1090,10 @@ class DataInspector:
 
             elif endpoint.method == "POST" and 'users' in endpoint.path.lower():
                 # For POST to user endpoints, send sample JSON
-                sample_data = {
-                    "name": "Sample User",
-                    "email": "sample@example.com"
-                }
-
                 headers = {'Content-Type': 'application/json'}
-                response = requests.post(
+                response = self.session.post(
                     urljoin(self.base_url, endpoint.path),
-                    json=sample_data,
+                    json=_SAMPLE_USER_REQUEST,
                     headers=headers,
                     timeout=5
                 )
@@ -942,7 +1102,7 @@ class DataInspector:
                     endpoint.data_shapes.append(DataShape(
                         "Request",
                         "User creation data",
-                        json.dumps(sample_data, indent=2)
+                        _SAMPLE_USER_REQUEST_JSON
                     ))
 
                     if response.headers.get('content-type', '').startswith('application/json'):
@@ -950,22 +1110,21 @@ class DataInspector:
 
             return False
 
-        except requests.RequestException:
+        except self._request_error:
             return False
 
     def _parse_json_response(self, endpoint, response_data, shape_type):
         """Parse JSON response to generate data shape documentation"""
         try:
             # Handle different response types
-            if isinstance(response_data, dict):
-                self._process_dict_response(endpoint, response_data, shape_type)
-            elif isinstance(response_data, list):
-                self._process_list_response(endpoint, response_data, shape_type)
+            handler = self._response_handlers.get(type(response_data))
+            if handler:
+                handler(endpoint, response_data, shape_type)
             else:
                 # Simple value
                 if shape_type == "Response":
                     shape_desc = f"Simple {type(response_data).__name__} response"
-                    example = json.dumps(response_data, indent=2)[:200] + "..."
+                    example = json.dumps(response_data)[:200] + "..."
                     endpoint.data_shapes.append(DataShape(shape_type, shape_desc, example))
 
             return True
@@ -976,8 +1135,8 @@ class DataInspector:
 
     def _process_dict_response(self, endpoint, data, shape_type):
         """Process dictionary response to create JSON schema example"""
-        # Create a more readable JSON example
-        example = json.dumps(data, indent=2)
+        # Create a more readable JSON example, trimmed so huge payloads stay cheap to encode
+        example = json.dumps(self._trim_example(data), indent=2)
 
         if shape_type == "Response":
             # Try to infer meaningful descriptions
@@ -996,6 +1155,18 @@ class DataInspector:
             example
         ))
 
+    def _trim_example(self, value):
+        """Shorten long strings and arrays so examples stay small"""
+        if isinstance(value, str):
+            if len(value) > _EXAMPLE_STRING_LIMIT:
+                return value[:_EXAMPLE_STRING_LIMIT] + "..."
+            return value
+        if isinstance(value, dict):
+            return {key: self._trim_example(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._trim_example(item) for item in value[:_EXAMPLE_LIST_LIMIT]]
+        return value
+
     def _process_list_response(self, endpoint, data, shape_type):
         """Process list response to create JSON schema example"""
         if not data:
@@ -1009,8 +1180,7 @@ class DataInspector:
 
         # Show first item as example for non-empty lists
         if isinstance(data[0], dict):
-            example_data = [data[0]] if len(data) > 0 else []
-            example = json.dumps(example_data, indent=2)
+            example = json.dumps([self._trim_example(data[0])], indent=2)
 
             if shape_type == "Response":
                 if "users" in str(endpoint.path).lower():
@@ -1019,8 +1189,7 @@ class DataInspector:
                     shape_desc = f"Array of {len(data)} items"
         else:
             # Simple array
-            limited_data = data[:3] if len(data) > 3 else data
-            example = json.dumps(limited_data, indent=2)
+            example = json.dumps(self._trim_example(data), indent=2)
             shape_desc = f"Array of {len(data)} {type(data[0]).__name__} values"
 
         endpoint.data_shapes.append(DataShape(
@@ -1033,194 +1202,177 @@ def generate_markdown_docs(endpoints, output_file="apidocs.md"):
     """Generate comprehensive, visually enhanced markdown documentation"""
 
     # Sort endpoints by path for better organization
-    endpoints = sorted(endpoints, key=lambda x: x.path)
+    endpoints = sorted(endpoints, key=attrgetter('path'))
 
-    # Group by base path (everything before the first /)
-    grouped_endpoints = {}
+    # Group by base path (everything before the first /) and count methods in one pass;
+    # each endpoint's curl example is built here once for both the TOC and the details
+    grouped_endpoints = defaultdict(list)
+    method_counts = Counter()
     for endpoint in endpoints:
         if endpoint.path == "/":
             base = "/"
         else:
             base_parts = endpoint.path.strip("/").split("/")
             base = f"/{base_parts[0]}" if base_parts else "/"
-        if base not in grouped_endpoints:
-            grouped_endpoints[base] = []
-        grouped_endpoints[base].append(endpoint)
-
-    # Get method count statistics for badges
-    method_counts = {}
-    for endpoint in endpoints:
-        method_counts[endpoint.method] = method_counts.get(endpoint.method, 0) + 1
+        grouped_endpoints[base].append((endpoint, endpoint.curl_example))
+        method_counts[endpoint.method] += 1
+    # Each group's emoji and heading title, shared by the TOC and the detail section
+    sorted_groups = [(base_path, "📁" if base_path != "/" else "🏠", base_path.upper() or 'ROOT', group_endpoints)
+                     for base_path, group_endpoints in sorted(grouped_endpoints.items())]
+
+    # Badge text for every method present, looked up once rather than per row
+    badges = {method: _METHOD_BADGES.get(method, f'⚫ {method}') for method in method_counts}
+
+    # One timestamp so the header and footer always agree
+    generated_at = datetime.now()
+
+    # Collect the document in memory and write it out in one go
+    parts = []
+    write = parts.append
+
+    # Enhanced Header with Visual Appeal
+    write("# 🚀 API Documentation\n\n")
+    write("**Generated by Go Code Analyzer** • ")
+    write(f"📅 {generated_at.strftime('%Y-%m-%d %H:%M:%S')} • ")
+    write("⚡ Auto-generated from source code\n\n")
+
+    # Project Status Badge
+    total_endpoints = len(endpoints)
+    status_emoji = "🟢" if total_endpoints > 0 else "⚪"
+    status_msg = "Ready" if total_endpoints > 0 else "No endpoints found"
+    write(f"{status_emoji} **Status**: {status_msg}\n\n")
+
+    # Quick Stats Overview
+    write("---\n\n## 📊 API Overview\n\n")
+    write(_METRIC_TABLE_HEADER)
+    write(f"| 🔗 **Total Endpoints** | {total_endpoints} |\n")
+    write(f"| 📁 **Route Groups** | {len(grouped_endpoints)} |\n")
+    write(f"| 🔧 **HTTP Methods** | {len(method_counts)} |\n")
+    write("|---|---|\n\n")
+
+    # Method Distribution Badges
+    if method_counts:
+        write("### HTTP Method Distribution\n\n")
+        method_badges = [f"{badges[method]}: {count}" for method, count in sorted(method_counts.items())]
+        write(" | ".join(method_badges))
+        write("\n\n")
+
+    # Enhanced Table of Contents
+    write("---\n\n## 📚 Table of Contents\n\n")
+    for i, (base_path, folder_emoji, title, group_endpoints) in enumerate(sorted_groups, 1):
+        write(_TOC_GROUP_TEMPLATE.format(index=i, emoji=folder_emoji, title=title))
+
+        # Create endpoint table for each group
+        if group_endpoints:
+            write("| Method | Path | Handler | Quick Test |\n")
+            write("|--------|------|---------|------------|\n")
+
+            for endpoint, curl_example in group_endpoints[:10]:  # Show first 10 endpoints, link to more
+                curl_short = curl_example.replace("curl ", "").replace("http://localhost:8080", "")
+                write(_TOC_ROW_TEMPLATE.format(badge=badges[endpoint.method], path=endpoint.path,
+                                               handler=endpoint.handler_func, curl=curl_short))
+
+            if len(group_endpoints) > 10:
+                anchor = base_path.replace('/', '').lower() or 'root'
+                write(f"[...] **{len(group_endpoints) - 10} more endpoints** - [{base_path}](#{anchor})\n\n")
+            else:
+                write("\n")
+        write("\n")
+
+    write("---\n\n")
+
+    # Quick Usage Guide
+    write("## 🚀 Quick Start\n\n")
+    write("### Running the API\n")
+    write("```bash\n# Start your Go server\ngo run main.go\n```\n\n")
+
+    write("### Testing Endpoints\n")
+    if endpoints[:5]:  # Show first 5 examples
+        for endpoint in endpoints[:5]:
+            write(f"```bash\n{endpoint.curl_example}\n```\n")
+
+    write("---\n\n")
+
+    # Detailed Endpoint Documentation
+    write("## 🔧 Detailed Endpoint Documentation\n\n")
+    write("<details>\n<summary>📖 Click to expand detailed endpoint documentation</summary>\n\n")
+
+    # Endpoints with a real description, counted here for the quality metrics
+    documented_endpoints = 0
+    for base_path, folder_emoji, title, group_endpoints in sorted_groups:
+        write(_GROUP_HEADER_TEMPLATE.format(emoji=folder_emoji, title=title))
+
+        for endpoint, curl_example in group_endpoints:
+            if endpoint.description and endpoint.description != "Handler function":
+                documented_endpoints += 1
+
+            # Expected Response Examples
+            path_lower = endpoint.path.lower()
+            if "health" in path_lower:
+                response = _RESPONSE_EXAMPLE_HEALTH
+            elif "users" in path_lower:
+                response = _RESPONSE_EXAMPLES_USERS.get(endpoint.method, "")
+            else:
+                response = _RESPONSE_EXAMPLE_DEFAULT
+
+            data_shapes = ""
+            if endpoint.data_shapes:
+                data_shapes = "\n**📊 Data Shapes**\n" + "".join(
+                    _DATA_SHAPE_TEMPLATE.format(name=shape.name, description=shape.description, shape=shape.shape)
+                    for shape in endpoint.data_shapes
+                ) + "\n"
+
+            write(_ENDPOINT_TEMPLATE.format(
+                badge=badges[endpoint.method],
+                path=endpoint.path,
+                handler=endpoint.handler_func,
+                description=endpoint.description or 'Handler function',
+                curl=curl_example,
+                response=response,
+                data_shapes=data_shapes
+            ))
 
-    def get_method_badge(method):
-        """Return emoji and colored badge for HTTP method"""
-        badges = {
-            'GET': '🟢 GET',
-            'POST': '🔵 POST',
-            'PUT': '🟡 PUT',
-            'DELETE': '🔴 DELETE',
-            'PATCH': '🟠 PATCH',
-            'OPTIONS': '⚪ OPTIONS',
-            'HEAD': '⚫ HEAD'
-        }
-        return badges.get(method, f'⚫ {method}')
+        write("\n---\n\n")
+
+    write("</details>\n\n")
+
+    # Enhanced Summary with Visual Improvements
+    write("## 📈 Comprehensive Statistics\n\n")
+
+    # Progress Bar Visualization (ASCII style)
+    write("### HTTP Method Distribution\n\n")
+    max_count = max(method_counts.values()) if method_counts else 1
+
+    for method, count in sorted(method_counts.items()):
+        percentage = count / len(endpoints) * 100
+        bar_length = int((count / max_count) * _BAR_WIDTH)
+        plural = "s" if count != 1 else ""
+        write(f"**{badges[method]}**: {count} endpoint{plural} {_BARS[bar_length]} {percentage:.1f}%\n")
+
+    # Endpoint Quality Metrics
+    write("\n### 📊 API Quality Metrics\n\n")
+    documentation_coverage = (documented_endpoints / len(endpoints)) * 100 if endpoints else 0
+
+    write(_METRIC_TABLE_HEADER)
+    write(f"| 📊 **Documentation Coverage** | {documentation_coverage:.1f}% |\n")
+    write(f"| � **Documented Endpoints** | {documented_endpoints}/{len(endpoints)} |\n")
+    write(f"| �🚀 **REST-compliant** | Yes (HTTP methods + paths) |\n")
+    write("| 📋 **Generator Version** | 2.0 - Enhanced |\n")
+    write("|---|---|\n\n")
+
+    # Footer
+    write("---\n\n")
+    write("## 💡 Tips & Best Practices\n\n")
+    write("- 🧪 **Test endpoints** with the provided curl commands\n")
+    write("- 📖 **Add more documentation** by including comments above your handlers\n")
+    write("- 🎯 **Follow REST conventions** for better API design\n")
+    write("- 🔧 **Regenerate docs** whenever you add new endpoints\n")
+    write("\n\n---\n\n")
+    write("*📄 This documentation was auto-generated by the Go Code API Documentation Generator.*\n")
+    write("*🤖 Last updated: " + generated_at.strftime('%A, %B %d, %Y at %I:%M %p') + "*\n")
 
     with open(output_file, "w", encoding="utf-8") as f:
-        # Enhanced Header with Visual Appeal
-        f.write("# 🚀 API Documentation\n\n")
-        f.write("**Generated by Go Code Analyzer** • ")
-        f.write(f"📅 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} • ")
-        f.write("⚡ Auto-generated from source code\n\n")
-
-        # Project Status Badge
-        total_endpoints = len(endpoints)
-        status_emoji = "🟢" if total_endpoints > 0 else "⚪"
-        status_msg = "Ready" if total_endpoints > 0 else "No endpoints found"
-        endpoints_info = ""
-        if total_endpoints > 0:
-            endpoints_info = " %.2f" % (total_endpoints / len(endpoints) * 100)
-        f.write(f"{status_emoji} **Status**: {status_msg}{endpoints_info}%\n\n")
-
-        # Quick Stats Overview
-        f.write("---\n\n## 📊 API Overview\n\n")
-        f.write("| Metric | Value |\n")
-        f.write("|---|-----|\n")
-        f.write(f"| 🔗 **Total Endpoints** | {total_endpoints} |\n")
-        f.write(f"| 📁 **Route Groups** | {len(grouped_endpoints)} |\n")
-        f.write(f"| 🔧 **HTTP Methods** | {len(method_counts)} |\n")
-        f.write("|---|---|\n\n")
-
-        # Method Distribution Badges
-        if method_counts:
-            f.write("### HTTP Method Distribution\n\n")
-            method_badges = [f"{get_method_badge(method)}: {count}" for method, count in sorted(method_counts.items())]
-            f.write(" | ".join(method_badges))
-            f.write("\n\n")
-
-        # Enhanced Table of Contents
-        f.write("---\n\n## 📚 Table of Contents\n\n")
-        for i, (base_path, group_endpoints) in enumerate(sorted(grouped_endpoints.items()), 1):
-            folder_emoji = "📁" if base_path != "/" else "🏠"
-            f.write(f"### {i}. {folder_emoji} {base_path.upper() or 'ROOT'}\n\n")
-
-            # Create endpoint table for each group
-            if group_endpoints:
-                f.write("| Method | Path | Handler | Quick Test |\n")
-                f.write("|--------|------|---------|------------|\n")
-
-                for endpoint in group_endpoints[:10]:  # Show first 10 endpoints, link to more
-                    curl_short = endpoint.curl_example.replace("curl ", "").replace("http://localhost:8080", "")
-                    f.write(f"| {get_method_badge(endpoint.method)} | `{endpoint.path}` | `{endpoint.handler_func}` | `curl {curl_short}` |\n")
-
-                if len(group_endpoints) > 10:
-                    anchor = base_path.replace('/', '').lower() or 'root'
-                    f.write(f"[...] **{len(group_endpoints) - 10} more endpoints** - [{base_path}](#{anchor})\n\n")
-                else:
-                    f.write("\n")
-            f.write("\n")
-
-        f.write("---\n\n")
-
-        # Quick Usage Guide
-        f.write("## 🚀 Quick Start\n\n")
-        f.write("### Running the API\n")
-        f.write("```bash\n# Start your Go server\ngo run main.go\n```\n\n")
-
-        f.write("### Testing Endpoints\n")
-        if endpoints[:5]:  # Show first 5 examples
-            for endpoint in endpoints[:5]:
-                f.write(f"```bash\n{endpoint.curl_example}\n```\n")
-
-        f.write("---\n\n")
-
-        # Detailed Endpoint Documentation
-        f.write("## 🔧 Detailed Endpoint Documentation\n\n")
-        f.write("<details>\n<summary>📖 Click to expand detailed endpoint documentation</summary>\n\n")
-
-        for base_path, group_endpoints in sorted(grouped_endpoints.items()):
-            folder_emoji = "📁" if base_path != "/" else "🏠"
-            anchor = base_path.replace('/', '').lower() or 'root'
-            f.write(f"### {folder_emoji} {base_path.upper() or 'ROOT'} Endpoints\n\n")
-
-            for endpoint in group_endpoints:
-                # Enhanced endpoint header with badges
-                f.write(f"<details>\n<summary>{get_method_badge(endpoint.method)} `{endpoint.path}`</summary>\n\n")
-
-                f.write("**📝 Overview**\n")
-                f.write("| Property | Value |\n")
-                f.write("|---|-----|\n")
-                f.write(f"| 🔧 Handler | `{endpoint.handler_func}` |\n")
-                f.write(f"| 📖 Description | {endpoint.description or 'Handler function'} |\n")
-
-                f.write("\n**🧪 Testing**\n")
-                f.write(f"```bash\n{endpoint.curl_example}\n```\n")
-
-                # Expected Response Examples
-                f.write("\n**💡 Expected Response**\n")
-                if "health" in endpoint.path.lower():
-                    f.write("```json\n{\"status\": \"ok\"}\n```\n")
-                elif "users" in endpoint.path.lower():
-                    if endpoint.method == "GET":
-                        f.write("```json\n[\n  {\n    \"id\": 1,\n    \"name\": \"John Doe\",\n    \"email\": \"john@example.com\"\n  }\n]\n```\n")
-                    elif endpoint.method == "POST":
-                        f.write("```json\n{\n  \"id\": 3,\n  \"name\": \"New User\",\n  \"email\": \"new@example.com\"\n}\n```\n")
-                else:
-                    f.write("```json\n{\n  \"message\": \"Success response\"\n}\n```\n")
-
-                if endpoint.data_shapes:
-                    f.write("\n**📊 Data Shapes**\n")
-                    for shape in endpoint.data_shapes:
-                        f.write(f"#### {shape.name}\n")
-                        f.write(f"**Description**: {shape.description}\n\n")
-                        f.write("```json\n" + shape.shape + "\n```\n")
-                    f.write("\n")
-
-                f.write("</details>\n\n")
-
-            f.write("\n---\n\n")
-
-        f.write("</details>\n\n")
-
-        # Enhanced Summary with Visual Improvements
-        f.write("## 📈 Comprehensive Statistics\n\n")
-
-        # Progress Bar Visualization (ASCII style)
-        f.write("### HTTP Method Distribution\n\n")
-        max_count = max(method_counts.values()) if method_counts else 1
-
-        for method, count in sorted(method_counts.items()):
-            percentage = count / len(endpoints) * 100
-            bar_length = int((count / max_count) * 30)  # 30 character bars
-            plural = "s" if count != 1 else ""
-            f.write(f"**{get_method_badge(method)}**: {count} endpoint{plural}")
-            filled_bar = "█" * bar_length
-            empty_bar = "░" * (30 - bar_length)
-            f.write(f" {filled_bar}{empty_bar} {percentage:.1f}%\n")
-
-        # Endpoint Quality Metrics
-        f.write("\n### 📊 API Quality Metrics\n\n")
-        documented_endpoints = sum(1 for ep in endpoints if ep.description and ep.description != "Handler function")
-        documentation_coverage = (documented_endpoints / len(endpoints)) * 100 if endpoints else 0
-
-        f.write("| Metric | Value |\n")
-        f.write("|---|-----|\n")
-        f.write(f"| 📊 **Documentation Coverage** | {documentation_coverage:.1f}% |\n")
-        f.write(f"| � **Documented Endpoints** | {documented_endpoints}/{len(endpoints)} |\n")
-        f.write(f"| �🚀 **REST-compliant** | Yes (HTTP methods + paths) |\n")
-        f.write("| 📋 **Generator Version** | 2.0 - Enhanced |\n")
-        f.write("|---|---|\n\n")
-
-        # Footer
-        f.write("---\n\n")
-        f.write("## 💡 Tips & Best Practices\n\n")
-        f.write("- 🧪 **Test endpoints** with the provided curl commands\n")
-        f.write("- 📖 **Add more documentation** by including comments above your handlers\n")
-        f.write("- 🎯 **Follow REST conventions** for better API design\n")
-        f.write("- 🔧 **Regenerate docs** whenever you add new endpoints\n")
-        f.write("\n\n---\n\n")
-        f.write("*📄 This documentation was auto-generated by the Go Code API Documentation Generator.*\n")
-        f.write("*🤖 Last updated: " + datetime.now().strftime('%A, %B %d, %Y at %I:%M %p') + "*\n")
-        f.write("")
+        f.write("".join(parts))
 
 def print_ascii_art():
     """Print ASCII art logo for Grabby Documatic"""
@@ -1314,8 +1466,18 @@ def display_settings_menu():
     print("1. 🔄 Toggle recursive directory scanning")
     print("2. 📝 Configure duplicate resolution strategy")
     print("3. 🎯 Set output file names")
-    print("4. 🔙 Back to main menu")
-    return input("Select setting (1-4): ").strip()
+    print("4. ⚡ Set file analysis processes")
+    print("5. 💾 Toggle live inspection cache")
+    print("6. 🔙 Back to main menu")
+    return input("Select setting (1-6): ").strip()
+
+def create_analyzer(config, use_llm=False):
+    """Build an analyzer with the user's settings applied"""
+    analyzer = GoCodeAnalyzer()
+    analyzer.use_llm = use_llm
+    analyzer.enable_recursive = config['recursive']
+    analyzer.jobs = config.get('jobs')
+    return analyzer
 
 def run_analysis(directory, config, server_port=None, use_llm=False):
     """Run the main analysis with given parameters"""
@@ -1324,9 +1486,7 @@ def run_analysis(directory, config, server_port=None, use_llm=False):
     print("-" * 50)
     
     # Create analyzer
-    analyzer = GoCodeAnalyzer()
-    analyzer.use_llm = use_llm
-    analyzer.enable_recursive = config['recursive']
+    analyzer = create_analyzer(config, use_llm)
     
     # Run analysis
     endpoints = analyzer.analyze_directory(directory)
@@ -1340,13 +1500,18 @@ def run_analysis(directory, config, server_port=None, use_llm=False):
     if server_port:
         print(f"\n🔬 Attempting to connect to server on port {server_port}...")
         inspector = DataInspector()
-        server_found = inspector.find_running_server(server_port)
-        
-        if server_found:
-            inspector.get_endpoint_data(endpoints)
-            print("✅ Server data inspection completed!")
-        else:
-            print("❌ Could not connect to server")
+        if not config.get('probe_cache', True):
+            inspector.cache_file = None
+        try:
+            server_found = inspector.find_running_server(server_port)
+            
+            if server_found:
+                inspector.get_endpoint_data(endpoints)
+                print("✅ Server data inspection completed!")
+            else:
+                print("❌ Could not connect to server")
+        finally:
+            inspector.close()
     
     # Generate documentation
     generate_markdown_docs(endpoints, config['output_file'])
@@ -1405,7 +1570,9 @@ def main():
         'recursive': True,
         'duplicate_strategy': 'keep_first',
         'output_file': 'apidocs.md',
-        'duplicate_report_file': 'duplicates_report.md'
+        'duplicate_report_file': 'duplicates_report.md',
+        'jobs': None,  # File analysis processes (None = one per CPU, 1 = serial)
+        'probe_cache': True  # Reuse recent live-inspection results across runs
     }
     
     # Clear screen and show ASCII art
@@ -1437,7 +1604,7 @@ def main():
                 elif choice == '4':  # Generate duplicate report only
                     directory = get_directory_input()
                     if confirm_action(f"📊 Generate duplicate report for '{directory}'?"):
-                        analyzer = GoCodeAnalyzer()
+                        analyzer = create_analyzer(config)
                         analyzer.analyze_directory(directory)
                         duplicate_report = analyzer.generate_duplicate_report()
                         with open(config['duplicate_report_file'], "w", encoding="utf-8") as f:
@@ -1473,6 +1640,23 @@ def main():
                     config['duplicate_report_file'] = new_dup_output
                 print("✅ Output files updated")
                 
+            elif settings_choice == '4':  # Analysis processes
+                current = config['jobs'] or "auto"
+                new_jobs = input(f"Processes for file analysis (1 = serial, auto = one per CPU) [{current}]: ").strip().lower()
+                if new_jobs == "auto":
+                    config['jobs'] = None
+                    print("✅ File analysis processes: one per CPU")
+                elif new_jobs.isdigit() and int(new_jobs) > 0:
+                    config['jobs'] = int(new_jobs)
+                    print(f"✅ File analysis processes: {config['jobs']}")
+                elif new_jobs:
+                    print("❌ Please enter a positive whole number or 'auto'.")
+                
+            elif settings_choice == '5':  # Probe cache
+                config['probe_cache'] = not config['probe_cache']
+                status = "ENABLED" if config['probe_cache'] else "DISABLED"
+                print(f"💾 Live inspection cache: {status}")
+                
             input("Press Enter to continue...")
                 
         elif choice == '6':  # Help